@@ -1,10 +1,35 @@
+import os
 import shutil
 import re
+import functools
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from pydal.objects import Row
 from tipitaka_dal import TipitakaDAL
 from aksharamukha import transliterate
 
 
+@functools.lru_cache(maxsize=16_384)
+def _transliterate(original_script, target_script, text):
+    """
+    Memoized Aksharamukha conversion for short, repeated strings.
+    
+    Book names, abbreviations and chapter titles recur across books, so
+    results are cached per (original_script, target_script, text). Page
+    text bypasses this cache: paragraphs rarely repeat and would only pin
+    memory in every worker. Exceptions are not cached.
+    """
+    return transliterate.process(original_script, target_script, text)
+
+
+# Myanmar and Myanmar Extended-A code points; text without them needs no transliteration
+_HAS_MYANMAR = re.compile(r'[\u1000-\u109F\uAA60-\uAA7F]')
+
+# Splits HTML into alternating text/tag tokens (tags land on odd indices)
+_TAG_RE = re.compile(r'(<[^>]*>)')
+
+
 class TipitakaBuilder:
     """
     A systematic builder for generating Tipitaka documentation files across multiple scripts.
@@ -14,10 +39,18 @@ class TipitakaBuilder:
     structured Markdown files for Astro Starlight documentation.
     """
     
-    def __init__(self):
-        """Initialize the builder with configuration and database connection."""
+    def __init__(self, max_workers=None, io_workers=8):
+        """
+        Initialize the builder with configuration and database connection.
+        
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count)
+            io_workers: Number of writer threads per process for file output
+        """
         self.dal = None
         self.db = None
+        self.max_workers = max_workers or os.cpu_count()
+        self.io_workers = io_workers
         self._setup_configuration()
         self._setup_paths()
         
@@ -72,6 +105,17 @@ class TipitakaBuilder:
             }
         ]
         
+        # Transliteration configuration indexed by script code
+        self._trans_config_by_code = {
+            config['code']: config for config in self.transliteration_config
+        }
+        
+        # Precompiled correction rules per script code
+        self.compiled_corrections = {
+            config['code']: self._compile_corrections(config['correction'])
+            for config in self.transliteration_config
+        }
+        
         # Directory structure configuration
         self.sections = ["mula", "attha", "tika"]
         self.subsections = ["vi", "su", "bi"]
@@ -106,6 +150,27 @@ paranum: {paranum}
 {content}
 """
 
+        # Page template compiled once into an f-string render function
+        self._render_page = self._compile_template(
+            self.page_template, ['chapter_name', 'page_num', 'order', 'paranum', 'content']
+        )
+
+    def _compile_template(self, template, field_names):
+        """
+        Compile a str.format template into a function evaluating an equivalent f-string.
+        
+        Args:
+            template: Template string using {field} placeholders
+            field_names: Names of the template fields
+            
+        Returns:
+            Function taking the fields as keyword arguments and returning the rendered text
+        """
+        source = f"def render({', '.join(field_names)}):\n    return f{template!r}\n"
+        namespace = {}
+        exec(compile(source, '<template>', 'exec'), namespace)
+        return namespace['render']
+
     def _setup_paths(self):
         """Setup project paths for file generation."""
         self.project_root = Path(__file__).resolve().parent.parent.parent
@@ -121,7 +186,35 @@ paranum: {paranum}
         self.category_data = self.db(self.db.category).select()
         self.books_data = self.db(self.db.books).select()
         self.tocs_data = self.db(self.db.tocs).select()
-        self.pages_data = self.db(self.db.pages).select()
+        self.pages_by_book = self.load_pages_by_book()
+
+    def load_pages_by_book(self):
+        """
+        Load all pages with one query as plain tuples grouped by book.
+        
+        The query is built with pyDAL but executed raw, so no Row objects are
+        constructed for the (large) pages table.
+        
+        Returns:
+            Dictionary mapping book ID to parallel lists 'num', 'content' and
+            'paranum' sorted by page number
+        """
+        pages = self.db.pages
+        sql = self.db(pages)._select(
+            pages.bookid, pages.page, pages.content, pages.paranum,
+            orderby=pages.bookid | pages.page
+        )
+        
+        pages_by_book = {}
+        for book_id, page_num, content, paranum in self.db.executesql(sql):
+            book_pages = pages_by_book.get(book_id)
+            if book_pages is None:
+                book_pages = pages_by_book[book_id] = {"num": [], "content": [], "paranum": []}
+            book_pages["num"].append(page_num)
+            book_pages["content"].append(content)
+            book_pages["paranum"].append(paranum)
+        
+        return pages_by_book
 
     def convert_text_with_aksharamukha(self, text, original_script, target_script):
         """
@@ -138,43 +231,77 @@ paranum: {paranum}
         if not text or not isinstance(text, str) or text.strip() == "":
             return text
         
+        # Skip spans with nothing to transliterate (digits, separators, Latin text)
+        if _HAS_MYANMAR.search(text) is None:
+            return text
+        
         try:
-            converted = transliterate.process(original_script, target_script, text)
+            converted = _transliterate(original_script, target_script, text)
             return converted
         except Exception as e:
             print(f"Warning: Could not convert '{text[:30]}...' to {target_script}: {str(e)}")
             return text
 
-    def apply_text_corrections(self, text, corrections):
+    def _compile_corrections(self, corrections):
         """
-        Apply correction rules to converted text.
+        Compile correction rules into a single-pass replacement function.
+        
+        Every rule set is applied in one pass over the text. Single-character
+        sources use str.translate and a single rule uses str.replace, both of
+        which run entirely in C; mixed rule sets use one alternation regex.
         
         Args:
-            text: Text to correct
             corrections: List of correction rules
             
+        Returns:
+            Callable taking and returning text, or None if there are no rules
+        """
+        mapping = {
+            correction["from"]: correction.get("to", "")
+            for correction in corrections
+            if correction.get("from")
+        }
+        if not mapping:
+            return None
+        
+        if all(len(from_text) == 1 for from_text in mapping):
+            table = str.maketrans(mapping)
+            return lambda text: text.translate(table)
+        
+        if len(mapping) == 1:
+            ((from_text, to_text),) = mapping.items()
+            return lambda text: text.replace(from_text, to_text)
+        
+        # Longest patterns first so overlapping rules prefer the longer match
+        pattern = re.compile("|".join(
+            re.escape(from_text) for from_text in sorted(mapping, key=len, reverse=True)
+        ))
+        return functools.partial(pattern.sub, lambda match: mapping[match.group(0)])
+
+    def apply_text_corrections(self, text, compiled_corrections):
+        """
+        Apply correction rules to converted text in a single pass.
+        
+        Args:
+            text: Text to correct
+            compiled_corrections: Function from _compile_corrections or None
+            
         Returns:
             Corrected text
         """
-        if not text or not corrections:
+        if not text or not compiled_corrections:
             return text
         
-        corrected_text = text
-        for correction in corrections:
-            from_text = correction.get("from", "")
-            to_text = correction.get("to", "")
-            if from_text:
-                corrected_text = corrected_text.replace(from_text, to_text)
-        
-        return corrected_text
+        return compiled_corrections(text)
 
-    def convert_html_content(self, html_content, script_code):
+    def convert_html_content(self, html_content, script_code, tokens=None):
         """
         Convert text content within HTML tags while preserving HTML structure.
         
         Args:
             html_content: HTML content string
             script_code: Target script code
+            tokens: html_content already split by _TAG_RE (optional, shared across scripts)
             
         Returns:
             HTML content with converted text
@@ -187,53 +314,75 @@ paranum: {paranum}
         if not trans_config:
             return html_content
         
-        def convert_text_match(match):
+        # Bind per-script settings and methods to locals once for the per-token closure
+        original_script = trans_config['from']
+        target_script = trans_config['to']
+        corrections = self.compiled_corrections.get(script_code)
+        process = transliterate.process
+        correct_text = self.apply_text_corrections
+        
+        def convert_text(text_content):
             """Convert text content between HTML tags."""
-            text_content = match.group(0)
-            
-            # Skip if it's only whitespace or empty
-            if not text_content.strip():
+            # Skip whitespace-only spans and spans with nothing to transliterate
+            if not text_content.strip() or _HAS_MYANMAR.search(text_content) is None:
                 return text_content
             
-            # Convert the text
-            converted = self.convert_text_with_aksharamukha(
-                text_content, trans_config['from'], trans_config['to']
-            )
-            converted = self.apply_text_corrections(converted, trans_config['correction'])
+            # Paragraphs rarely repeat, so call Aksharamukha directly rather than through the name cache
+            try:
+                converted = process(original_script, target_script, text_content)
+            except Exception as e:
+                print(f"Warning: Could not convert '{text_content[:30]}...' to {target_script}: {str(e)}")
+                return text_content
             
-            return converted
-        
-        # Pattern to match text content between HTML tags
-        # This matches text that is not inside < > brackets
-        pattern = r'(?<=>)[^<]+(?=<)|(?<=>)[^<]+$|^[^<]+(?=<)'
+            return correct_text(converted, corrections)
         
         try:
-            # Convert text content while preserving HTML structure
-            converted_html = re.sub(pattern, convert_text_match, html_content)
-            return converted_html
+            # Convert text tokens while preserving HTML structure
+            tokens = list(tokens if tokens is not None else _TAG_RE.split(html_content))
+            for index in range(0, len(tokens), 2):
+                tokens[index] = convert_text(tokens[index])
+            return "".join(tokens)
         except Exception as e:
             print(f"Warning: Could not convert HTML content for {script_code}: {str(e)}")
             return html_content
 
     def create_directory_structure(self):
-        """Create the basic directory structure for all scripts."""
-        for script in self.script_codes:
-            script_dir = self.src_dir / script
-            
-            # Remove existing directory if it exists
-            if script_dir.exists():
-                shutil.rmtree(script_dir)
+        """
+        Create the basic directory structure for all scripts.
+        
+        Script trees are independent, so removals and then creations run on
+        a thread pool to overlap the filesystem calls.
+        """
+        with ThreadPoolExecutor(max_workers=len(self.script_codes)) as executor:
+            # Remove existing directories
+            removals = [
+                executor.submit(shutil.rmtree, self.src_dir / script, ignore_errors=True)
+                for script in self.script_codes
+            ]
+            for future in removals:
+                future.result()
             
             # Create directory structure based on sections and subsections
-            for section in self.sections:
-                for subsection in self.subsections:
-                    subsection_dir = script_dir / section / subsection
-                    subsection_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Create special subdirectories for 'su' (Sutta) section
-                    if subsection == "su":
-                        for subdivision in self.sutta_subdivisions:
-                            (subsection_dir / subdivision).mkdir(exist_ok=True)
+            directories = []
+            for script in self.script_codes:
+                for section in self.sections:
+                    for subsection in self.subsections:
+                        subsection_dir = self.src_dir / script / section / subsection
+                        
+                        # Create special subdirectories for 'su' (Sutta) section
+                        if subsection == "su":
+                            directories.extend(
+                                subsection_dir / subdivision for subdivision in self.sutta_subdivisions
+                            )
+                        else:
+                            directories.append(subsection_dir)
+            
+            creations = [
+                executor.submit(os.makedirs, directory, exist_ok=True)
+                for directory in directories
+            ]
+            for future in creations:
+                future.result()
 
     def parse_book_chapters(self, book_toc):
         """
@@ -273,117 +422,170 @@ paranum: {paranum}
         Returns:
             Transliteration configuration dictionary or None
         """
-        return next((config for config in self.transliteration_config 
-                    if config['code'] == script_code), None)
+        return self._trans_config_by_code.get(script_code)
 
-    def convert_book_content(self, book, chapters, script_code):
+    def convert_text_for_script(self, text, script_code):
         """
-        Convert book and chapter content to target script.
+        Convert text to a target script and apply its correction rules.
         
         Args:
-            book: Book record from database
-            chapters: List of chapter dictionaries
+            text: Text to convert
             script_code: Target script code
             
         Returns:
-            Tuple of (converted_book_name, converted_book_abbr, converted_chapters)
+            Converted text, or the original text for Myanmar / unknown scripts
         """
-        # Default values (Myanmar script)
-        book_name = book.name
-        book_abbr = book.abbr
-        script_chapters = [chapter.copy() for chapter in chapters]
-        
-        # Skip conversion for Myanmar script (original)
         if script_code == 'mymr':
-            return book_name, book_abbr, script_chapters
+            return text
         
-        # Get transliteration configuration
         trans_config = self.get_transliteration_config(script_code)
         if not trans_config:
-            return book_name, book_abbr, script_chapters
+            return text
         
-        # Convert book name
-        book_name = self.convert_text_with_aksharamukha(
-            book.name, trans_config['from'], trans_config['to']
+        converted = self.convert_text_with_aksharamukha(
+            text, trans_config['from'], trans_config['to']
         )
-        book_name = self.apply_text_corrections(book_name, trans_config['correction'])
+        return self.apply_text_corrections(converted, self.compiled_corrections.get(script_code))
+
+    def convert_book_names(self, book, chapters, script_codes=None):
+        """
+        Convert the book name and chapter names once per script.
         
-        # Convert book abbreviation
-        book_abbr = self.convert_text_with_aksharamukha(
-            book.abbr, trans_config['from'], trans_config['to']
-        )
-        book_abbr = self.apply_text_corrections(book_abbr, trans_config['correction'])
+        Args:
+            book: Book record from database
+            chapters: List of chapter dictionaries
+            script_codes: Target script codes (defaults to all scripts)
+            
+        Returns:
+            Dictionary mapping (name, script_code) to the converted name
+        """
+        unique_names = {chapter['name'] for chapter in chapters} | {book.name}
+        return {
+            (name, script_code): self.convert_text_for_script(name, script_code)
+            for name in unique_names
+            for script_code in (script_codes or self.script_codes)
+        }
+
+    def convert_book_content(self, book, chapters, script_code, converted_names=None):
+        """
+        Convert book and chapter content to target script.
         
-        # Convert chapter names
-        for chapter in script_chapters:
-            converted_name = self.convert_text_with_aksharamukha(
-                chapter['name'], trans_config['from'], trans_config['to']
-            )
-            converted_name = self.apply_text_corrections(converted_name, trans_config['correction'])
-            chapter['name'] = converted_name
+        Args:
+            book: Book record from database
+            chapters: List of chapter dictionaries
+            script_code: Target script code
+            converted_names: Precomputed mapping from convert_book_names (optional)
+            
+        Returns:
+            Tuple of (converted_book_name, book_abbr, converted_chapters); the
+            abbreviation is returned unconverted since it only names directories
+        """
+        if converted_names is None:
+            converted_names = self.convert_book_names(book, chapters, [script_code])
+        
+        book_name = converted_names[(book.name, script_code)]
+        book_abbr = book.abbr
+        script_chapters = [
+            {**chapter, 'name': converted_names[(chapter['name'], script_code)]}
+            for chapter in chapters
+        ]
         
         return book_name, book_abbr, script_chapters
 
-    def get_chapter_pages(self, book_id, start_page, end_page):
+    def get_chapter_end_page(self, chapters, index, book_lastpage):
         """
-        Get pages content for a specific chapter range.
+        Get the exclusive end page of a chapter.
         
         Args:
-            book_id: Book ID to filter pages
-            start_page: Starting page number (inclusive)
-            end_page: Ending page number (exclusive, None for last chapter)
+            chapters: List of chapter dictionaries
+            index: 1-based chapter index
+            book_lastpage: Last page number of the book
             
         Returns:
-            List of page records sorted by page number
+            Start page of the next chapter, or the page after the book's last page
+        """
+        if index < len(chapters):
+            return chapters[index]['page']  # Next chapter's start page
+        return book_lastpage + 1  # Last chapter goes to end of book
+
+    def get_book_pages(self, book_id):
         """
-        query = (self.db.pages.bookid == book_id) & (self.db.pages.page >= start_page)
+        Get all pages of a book from the preloaded page set.
         
-        if end_page is not None:
-            query = query & (self.db.pages.page < end_page)
+        Pages are returned as parallel lists (structure of arrays) so the hot
+        loops index plain lists instead of resolving Row attributes per page.
         
-        pages = self.db(query).select(orderby=self.db.pages.page)
-        return pages
+        Args:
+            book_id: Book ID to filter pages
+            
+        Returns:
+            Dictionary of parallel lists 'num', 'content' and 'paranum' sorted by page number
+        """
+        return self.pages_by_book.get(book_id, {"num": [], "content": [], "paranum": []})
+
+    def split_chapter_pages(self, pages, chapters, book_lastpage):
+        """
+        Partition a book's sorted pages into per-chapter page lists.
+        
+        Args:
+            pages: Parallel page lists from get_book_pages
+            chapters: List of chapter dictionaries
+            book_lastpage: Last page number of the book
+            
+        Returns:
+            List of parallel page lists, one per chapter
+        """
+        # Locate every chapter boundary once; chapter i spans offsets[i]:offsets[i + 1]
+        page_numbers = pages["num"]
+        boundaries = [chapter['page'] for chapter in chapters] + [book_lastpage + 1]
+        offsets = [bisect_left(page_numbers, boundary) for boundary in boundaries]
+        
+        return [
+            {key: values[start:end] for key, values in pages.items()}
+            for start, end in zip(offsets, offsets[1:])
+        ]
 
     def format_chapter_content(self, pages, chapter_name, script_code):
         """
         Format pages content into markdown with page separators and script conversion.
         
         Args:
-            pages: List of page records
+            pages: Parallel page lists for the chapter
             chapter_name: Name of the chapter
             script_code: Target script code for content conversion
             
         Returns:
             Tuple of (formatted_content, paranum_list, page_range)
         """
-        if not pages:
+        page_numbers = pages["num"]
+        if not page_numbers:
             return "ไม่มีเนื้อหา", [], "N/A"
         
         content_parts = []
         paranum_list = []
         
-        for page in pages:
+        for page_num, content, paranum in zip(page_numbers, pages["content"], pages["paranum"]):
             # Add page separator comment
-            content_parts.append(f"<!-- หน้า {page.page} -->")
+            content_parts.append(f"<!-- หน้า {page_num} -->")
             
             # Add page content with script conversion
-            if page.content:
+            if content:
                 # Convert HTML content to target script
-                converted_content = self.convert_html_content(page.content, script_code)
+                converted_content = self.convert_html_content(content, script_code)
                 content_parts.append(converted_content)
             else:
                 content_parts.append("<!-- ไม่มีเนื้อหาในหน้านี้ -->")
             
             # Collect paranum
-            if page.paranum:
-                paranum_list.append(page.paranum)
+            if paranum:
+                paranum_list.append(paranum)
             
             # Add spacing between pages
             content_parts.append("")
         
         # Create page range string
-        first_page = pages[0].page
-        last_page = pages[-1].page
+        first_page = page_numbers[0]
+        last_page = page_numbers[-1]
         page_range = f"{first_page}-{last_page}" if first_page != last_page else str(first_page)
         
         formatted_content = "\n".join(content_parts)
@@ -396,7 +598,7 @@ paranum: {paranum}
         
         Args:
             book: Book record from database
-            book_abbr: Book abbreviation (possibly converted)
+            book_abbr: Original book abbreviation
             script_code: Target script code
             
         Returns:
@@ -411,42 +613,85 @@ paranum: {paranum}
             # Other categories (vi, ab, etc.)
             return base_path / book.category / book_abbr
 
-    def create_chapter_files(self, book_path, chapters, book_id, book_lastpage, script_code):
+    def tokenize_chapter_pages(self, chapter_pages):
+        """
+        Split every page's HTML into text/tag tokens once for all target scripts.
+        
+        Adds a parallel 'tokens' list (None for empty pages) to each chapter's pages.
+        
+        Args:
+            chapter_pages: Parallel page lists, one per chapter (from split_chapter_pages)
+        """
+        for pages in chapter_pages:
+            pages["tokens"] = [
+                tuple(_TAG_RE.split(content)) if content else None
+                for content in pages["content"]
+            ]
+
+    def create_book_directories(self, book, chapters):
+        """
+        Create every chapter directory of a book for all scripts in one pass.
+        
+        Args:
+            book: Book record from database
+            chapters: List of chapter dictionaries
+        """
+        directories = set()
+        for script_code in self.script_codes:
+            book_path = self.determine_book_path(book, book.abbr, script_code)
+            directories.add(book_path)
+            directories.update(book_path / str(index) for index in range(1, len(chapters) + 1))
+        
+        # Sorted order creates parents before their children
+        for directory in sorted(directories):
+            os.makedirs(directory, exist_ok=True)
+
+    def write_file(self, file_path, text):
+        """
+        Write a text file with a single open/write/close sequence.
+        
+        Args:
+            file_path: Path of the file to write
+            text: File content
+        """
+        data = memoryview(text.encode('utf-8'))
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def create_chapter_files(self, book_path, chapters, chapter_pages, book_lastpage, script_code):
         """
         Create Markdown files for each chapter with individual page files to avoid memory issues.
+        Directories must already exist (see create_book_directories).
+        
+        File writes are batched per chapter on a thread pool so the many small
+        open/write/close syscalls overlap instead of blocking one after another.
         
         Args:
             book_path: Path to the book directory
             chapters: List of chapter dictionaries
-            book_id: Book ID for querying pages
+            chapter_pages: Parallel page lists, one per chapter (from split_chapter_pages),
+                with 'tokens' added by tokenize_chapter_pages
             book_lastpage: Last page number of the book
             script_code: Target script code for content conversion
         """
-        book_path.mkdir(parents=True, exist_ok=True)
-        
-        for index, chapter in enumerate(chapters, 1):
-            # Determine page range for this chapter
-            start_page = chapter['page']
-            
-            # End page is the start of next chapter, or book's last page for final chapter
-            if index < len(chapters):
-                end_page = chapters[index]['page']  # Next chapter's start page
-            else:
-                end_page = book_lastpage + 1  # Last chapter goes to end of book
-            
-            # Get pages content for this chapter
-            pages = self.get_chapter_pages(book_id, start_page, end_page)
-            
-            # Create chapter directory
-            chapter_dir = book_path / str(index)
-            chapter_dir.mkdir(exist_ok=True)
-            
-            # Create index file for chapter
-            chapter_index_file = chapter_dir / "index.md"
-            page_range = f"{start_page}-{end_page-1}" if start_page != end_page-1 else str(start_page)
-            
-            with open(chapter_index_file, 'w', encoding='utf-8') as file:
-                file.write(f"""---
+        with ThreadPoolExecutor(max_workers=self.io_workers) as writer:
+            for index, (chapter, pages) in enumerate(zip(chapters, chapter_pages), 1):
+                # Determine page range for this chapter
+                start_page = chapter['page']
+                end_page = self.get_chapter_end_page(chapters, index, book_lastpage)
+                
+                # Chapter directory is created up front by create_book_directories
+                chapter_dir = book_path / str(index)
+                
+                # Create index file for chapter
+                chapter_index_file = chapter_dir / "index.md"
+                page_range = f"{start_page}-{end_page-1}" if start_page != end_page-1 else str(start_page)
+                
+                pending = [writer.submit(self.write_file, chapter_index_file, f"""---
 title: {chapter['name']}
 sidebar: 
     order: {index}
@@ -455,47 +700,83 @@ page: {page_range}
 
 # {chapter['name']}
 
-บทนี้มี {len(pages)} หน้า (หน้า {start_page}-{end_page-1})
+บทนี้มี {len(pages["num"])} หน้า (หน้า {start_page}-{end_page-1})
 
-""")
-            
-            # Create individual page files
-            for page_index, page in enumerate(pages, 1):
-                if page.content:
-                    # Convert HTML content to target script
-                    converted_content = self.convert_html_content(page.content, script_code)
-                    
-                    # Create page file
-                    page_file = chapter_dir / f"page-{page.page}.md"
-                    with open(page_file, 'w', encoding='utf-8') as file:
-                        file.write(self.page_template.format(
+""")]
+                
+                # Create individual page files
+                page_rows = zip(pages["num"], pages["content"], pages["tokens"], pages["paranum"])
+                for page_index, (page_num, content, tokens, paranum) in enumerate(page_rows, 1):
+                    if content:
+                        # Convert HTML content to target script from the shared tokens
+                        converted_content = self.convert_html_content(content, script_code, tokens)
+                        
+                        # Queue page file
+                        page_file = chapter_dir / f"page-{page_num}.md"
+                        pending.append(writer.submit(self.write_file, page_file, self._render_page(
                             chapter_name=chapter['name'],
-                            page_num=page.page,
+                            page_num=page_num,
                             order=page_index,
-                            paranum=page.paranum or "",
+                            paranum=paranum or "",
                             content=converted_content
-                        ))
+                        )))
+                
+                # Flush the chapter's writes and surface any I/O errors
+                for future in pending:
+                    future.result()
+
+    def build_book_script(self, book, chapters, chapter_pages, script_code, converted_names=None):
+        """
+        Generate all chapter files of a single book for one target script.
+        
+        Args:
+            book: Book record from database
+            chapters: List of chapter dictionaries
+            chapter_pages: Parallel page lists, one per chapter
+            script_code: Target script code
+            converted_names: Precomputed mapping from convert_book_names (optional)
+        """
+        # Convert content to target script
+        book_name, book_abbr, script_chapters = self.convert_book_content(
+            book, chapters, script_code, converted_names
+        )
+        
+        # Determine file path
+        book_path = self.determine_book_path(book, book_abbr, script_code)
+        
+        # Create chapter files with actual content
+        self.create_chapter_files(book_path, script_chapters, chapter_pages, book.lastpage, script_code)
 
     def process_mula_books(self):
-        """Process all books with basket = 'mula' and generate files for all scripts."""
+        """
+        Process all books with basket = 'mula' and generate files for all scripts.
+        
+        Books write to disjoint directories, so they are distributed over a
+        process pool. Each worker renders one book into every script, which
+        lets each page be tokenized once and reused across all scripts.
+        """
         mula_books = self.db(self.db.books.basket == 'mula').select()
         
-        for book in mula_books:
-            # Parse chapters from table of contents
-            book_chapters = self.parse_book_chapters(book.toc)
-            
-            # Process each script
-            for script_code in self.script_codes:
-                # Convert content to target script
-                book_name, book_abbr, script_chapters = self.convert_book_content(
-                    book, book_chapters, script_code
-                )
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker, initargs=(self.io_workers,)
+        ) as executor:
+            futures = {}
+            for book in mula_books:
+                # Parse chapters from table of contents
+                book_chapters = self.parse_book_chapters(book.toc)
                 
-                # Determine file path
-                book_path = self.determine_book_path(book, book_abbr, script_code)
+                # Fetch the book's pages once and share them across all scripts
+                chapter_pages = self.split_chapter_pages(
+                    self.get_book_pages(book.id), book_chapters, book.lastpage
+                )
                 
-                # Create chapter files with actual content
-                self.create_chapter_files(book_path, script_chapters, book.id, book.lastpage, script_code)
+                # Submit one task per book with pickleable inputs
+                future = executor.submit(_build_book, book.as_dict(), book_chapters, chapter_pages)
+                futures[future] = book.id
+            
+            for future in as_completed(futures):
+                future.result()
+                print(f"  └─ {futures[future]} ✓ Complete")
 
     def build(self):
         """
@@ -524,6 +805,26 @@ page: {page_range}
         print("Build process completed successfully!")
 
 
+# === Worker Processes ===
+_worker_builder = None
+
+
+def _init_worker(io_workers):
+    """Create a per-process builder; pages are passed in, so no database is needed."""
+    global _worker_builder
+    _worker_builder = TipitakaBuilder(io_workers=io_workers)
+
+
+def _build_book(book_dict, chapters, chapter_pages):
+    """Build one book into every script inside a worker process."""
+    book = Row(book_dict)
+    _worker_builder.tokenize_chapter_pages(chapter_pages)
+    converted_names = _worker_builder.convert_book_names(book, chapters)
+    _worker_builder.create_book_directories(book, chapters)
+    for script_code in _worker_builder.script_codes:
+        _worker_builder.build_book_script(book, chapters, chapter_pages, script_code, converted_names)
+
+
 # === Main Execution ===
 if __name__ == "__main__":
     builder = TipitakaBuilder()
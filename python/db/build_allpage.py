@@ -1,10 +1,15 @@
 import shutil
 import re
+import json
 from pathlib import Path
 from tipitaka_dal import TipitakaDAL
 from aksharamukha import transliterate
 
 
+# Splits HTML into alternating text/tag tokens (tags land on odd indices)
+_TAG_RE = re.compile(r'(<[^>]*>)')
+
+
 class TipitakaBuilder:
     """
     A systematic builder for generating Tipitaka documentation files across multiple scripts.
@@ -90,6 +95,9 @@ paranum: {paranum_list}
 
 {content}
 """
+        
+        # Template halves around the content so chapters can be streamed to disk
+        self._chapter_head, self._chapter_tail = self.chapter_template.split("{content}")
 
     def _setup_paths(self):
         """Setup project paths for file generation."""
@@ -153,52 +161,46 @@ paranum: {paranum_list}
         
         return corrected_text
 
-    def convert_html_content(self, html_content, script_code):
+    def iter_converted_html(self, html_content, script_code):
         """
-        Convert text content within HTML tags while preserving HTML structure.
+        Convert text content within HTML tags while preserving HTML structure,
+        yielding the converted output token by token.
         
         Args:
             html_content: HTML content string
             script_code: Target script code
             
-        Returns:
-            HTML content with converted text
+        Yields:
+            HTML tags and converted text pieces in document order
         """
-        if not html_content or script_code == 'mymr':
-            return html_content
+        if not html_content:
+            return
+        
+        if script_code == 'mymr':
+            yield html_content
+            return
         
         # Get transliteration configuration
         trans_config = self.get_transliteration_config(script_code)
         if not trans_config:
-            return html_content
-        
-        def convert_text_match(match):
-            """Convert text content between HTML tags."""
-            text_content = match.group(0)
-            
-            # Skip if it's only whitespace or empty
-            if not text_content.strip():
-                return text_content
+            yield html_content
+            return
+        
+        for index, token in enumerate(_TAG_RE.split(html_content)):
+            # Odd tokens are tags; skip text that is only whitespace or empty
+            if index % 2 or not token.strip():
+                yield token
+                continue
             
             # Convert the text
-            converted = self.convert_text_with_aksharamukha(
-                text_content, trans_config['from'], trans_config['to']
-            )
-            converted = self.apply_text_corrections(converted, trans_config['correction'])
-            
-            return converted
-        
-        # Pattern to match text content between HTML tags
-        # This matches text that is not inside < > brackets
-        pattern = r'(?<=>)[^<]+(?=<)|(?<=>)[^<]+$|^[^<]+(?=<)'
-        
-        try:
-            # Convert text content while preserving HTML structure
-            converted_html = re.sub(pattern, convert_text_match, html_content)
-            return converted_html
-        except Exception as e:
-            print(f"Warning: Could not convert HTML content for {script_code}: {str(e)}")
-            return html_content
+            try:
+                converted = self.convert_text_with_aksharamukha(
+                    token, trans_config['from'], trans_config['to']
+                )
+                yield self.apply_text_corrections(converted, trans_config['correction'])
+            except Exception as e:
+                print(f"Warning: Could not convert HTML content for {script_code}: {str(e)}")
+                yield token
 
     def create_directory_structure(self):
         """Create the basic directory structure for all scripts."""
@@ -271,7 +273,8 @@ paranum: {paranum_list}
             script_code: Target script code
             
         Returns:
-            Tuple of (converted_book_name, converted_book_abbr, converted_chapters)
+            Tuple of (converted_book_name, book_abbr, converted_chapters); the
+            abbreviation is returned unconverted since it only names directories
         """
         # Default values (Myanmar script)
         book_name = book.name
@@ -293,12 +296,6 @@ paranum: {paranum_list}
         )
         book_name = self.apply_text_corrections(book_name, trans_config['correction'])
         
-        # Convert book abbreviation
-        book_abbr = self.convert_text_with_aksharamukha(
-            book.abbr, trans_config['from'], trans_config['to']
-        )
-        book_abbr = self.apply_text_corrections(book_abbr, trans_config['correction'])
-        
         # Convert chapter names
         for chapter in script_chapters:
             converted_name = self.convert_text_with_aksharamukha(
@@ -329,51 +326,57 @@ paranum: {paranum_list}
         pages = self.db(query).select(orderby=self.db.pages.page)
         return pages
 
-    def format_chapter_content(self, pages, chapter_name, script_code):
+    def get_chapter_metadata(self, pages):
         """
-        Format pages content into markdown with page separators and script conversion.
+        Collect frontmatter metadata for a chapter without converting content.
         
         Args:
             pages: List of page records
-            chapter_name: Name of the chapter
-            script_code: Target script code for content conversion
             
         Returns:
-            Tuple of (formatted_content, paranum_list, page_range)
+            Tuple of (paranum_list, page_range)
         """
         if not pages:
-            return "ไม่มีเนื้อหา", [], "N/A"
+            return [], "N/A"
         
-        content_parts = []
-        paranum_list = []
-        
-        for page in pages:
-            # Add page separator comment
-            content_parts.append(f"<!-- หน้า {page.page} -->")
-            
-            # Add page content with script conversion
-            if page.content:
-                # Convert HTML content to target script
-                converted_content = self.convert_html_content(page.content, script_code)
-                content_parts.append(converted_content)
-            else:
-                content_parts.append("<!-- ไม่มีเนื้อหาในหน้านี้ -->")
-            
-            # Collect paranum
-            if page.paranum:
-                paranum_list.append(page.paranum)
-            
-            # Add spacing between pages
-            content_parts.append("")
+        paranum_list = [page.paranum for page in pages if page.paranum]
         
         # Create page range string
         first_page = pages[0].page
         last_page = pages[-1].page
         page_range = f"{first_page}-{last_page}" if first_page != last_page else str(first_page)
         
-        formatted_content = "\n".join(content_parts)
+        return paranum_list, page_range
+
+    def iter_chapter_content(self, pages, script_code):
+        """
+        Yield chapter markdown with page separators and script conversion.
+        
+        Args:
+            pages: List of page records
+            script_code: Target script code for content conversion
+            
+        Yields:
+            Pieces of the chapter content in order
+        """
+        if not pages:
+            yield "ไม่มีเนื้อหา"
+            return
         
-        return formatted_content, paranum_list, page_range
+        for index, page in enumerate(pages):
+            # Add spacing between pages
+            if index:
+                yield "\n"
+            
+            # Add page separator comment
+            yield f"<!-- หน้า {page.page} -->\n"
+            
+            # Add page content with script conversion
+            if page.content:
+                yield from self.iter_converted_html(page.content, script_code)
+            else:
+                yield "<!-- ไม่มีเนื้อหาในหน้านี้ -->"
+            yield "\n"
 
     def determine_book_path(self, book, book_abbr, script_code):
         """
@@ -381,7 +384,7 @@ paranum: {paranum_list}
         
         Args:
             book: Book record from database
-            book_abbr: Book abbreviation (possibly converted)
+            book_abbr: Original book abbreviation
             script_code: Target script code
             
         Returns:
@@ -422,21 +425,20 @@ paranum: {paranum_list}
             # Get pages content for this chapter
             pages = self.get_chapter_pages(book_id, start_page, end_page)
             
-            # Format chapter content with all pages in one file
-            formatted_content, paranum_list, page_range = self.format_chapter_content(
-                pages, chapter['name'], script_code
-            )
+            # Frontmatter only needs page metadata, not converted content
+            paranum_list, page_range = self.get_chapter_metadata(pages)
             
-            # Create chapter file
+            # Create chapter file, streaming converted pages instead of joining them in memory
             chapter_file = book_path / f"{index}.md"
             with open(chapter_file, 'w', encoding='utf-8') as file:
-                file.write(self.chapter_template.format(
+                file.write(self._chapter_head.format(
                     name=chapter['name'],
                     order=index,
                     page_range=page_range,
-                    paranum_list=paranum_list,
-                    content=formatted_content
+                    paranum_list=json.dumps(paranum_list, ensure_ascii=False)
                 ))
+                file.writelines(self.iter_chapter_content(pages, script_code))
+                file.write(self._chapter_tail)
 
     def process_mula_books(self):
         """Process all books with basket = 'mula' and generate files for all scripts."""
@@ -1,9 +1,27 @@
+import os
 import shutil
+import argparse
+import re
+import functools
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from tipitaka_dal import TipitakaDAL
 from aksharamukha import transliterate
 
 
+# Myanmar and Myanmar Extended-A code points; text without them needs no transliteration
+_HAS_MYANMAR = re.compile(r'[\u1000-\u109F\uAA60-\uAA7F]')
+
+# Plain book and TOC records used in the hot loops instead of pyDAL Rows
+Book = namedtuple('Book', 'id name abbr category')
+Toc = namedtuple('Toc', 'type name page_number')
+
+
+# Aksharamukha has no precompiled per-(from, to) converter, so bind its entry point once
+_process = transliterate.process
+
+
 class TipitakaBuilder:
     """
     A systematic builder for generating Tipitaka documentation files across multiple scripts.
@@ -13,10 +31,16 @@ class TipitakaBuilder:
     structured Markdown files for Astro Starlight documentation.
     """
     
-    def __init__(self):
-        """Initialize the builder with configuration and database connection."""
-        self.dal = None
-        self.db = None
+    def __init__(self, max_workers=None):
+        """
+        Initialize the builder with configuration and database connection.
+        
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count)
+        """
+        self.max_workers = max_workers or os.cpu_count()
+        self._written = set()
+        self.xlit_table = {}
         self._setup_configuration()
         self._setup_paths()
         
@@ -71,23 +95,33 @@ class TipitakaBuilder:
             }
         ]
         
+        # Transliteration configuration indexed by script code
+        self._trans_by_code = {c['code']: c for c in self.transliteration_config}
+        
+        # Precompiled correction rules per script code
+        self.compiled_corrections = {
+            config['code']: self._compile_corrections(config['correction'])
+            for config in self.transliteration_config
+        }
+        
         # Directory structure configuration
         self.sections = ["mula", "attha", "tika"]
         self.subsections = ["vi", "su", "bi"]
         self.sutta_subdivisions = ["di", "ma", "sa", "an", "ku"]
         
         # Markdown template for content files
+        # %-style: (name, order, parent, page, name, page), faster than str.format per file
         self.content_template = """---
-title: {name}
+title: %s
 sidebar: 
-    order: {order}
-parent: {parent}
-page: {page}
+    order: %d
+parent: %s
+page: %s
 ---
 
-# {name}
+# %s
 
-หน้า {page}
+หน้า %s
 """
 
     def _setup_paths(self):
@@ -96,16 +130,29 @@ page: {page}
         self.src_dir = self.project_root / "src" / "content" / "docs"
 
     def connect_database(self):
-        """Establish database connection and load data."""
-        self.dal = TipitakaDAL()
-        self.dal.connect()
-        self.db = self.dal.db
-        
-        # Load all required data from database
-        self.category_data = self.db(self.db.category).select()
-        self.books_data = self.db(self.db.books).select()
-        self.tocs_data = self.db(self.db.tocs).select()
-        self.pages_data = self.db(self.db.pages).select()
+        """Open the database, load the data the tree needs and close it again."""
+        # Load only mula books and their TOCs (no pages) through the raw sqlite3
+        # connection; pyDAL is not needed, so it is never connected.
+        dal = TipitakaDAL()
+        try:
+            conn = dal.raw_conn
+            self.books_data = [
+                Book(*row) for row in conn.execute(
+                    "SELECT id, name, abbr, category FROM books WHERE basket = 'mula'"
+                )
+            ]
+            self.tocs_data = conn.execute(
+                "SELECT book_id, type, name, page_number FROM tocs "
+                "WHERE book_id IN (SELECT id FROM books WHERE basket = 'mula') "
+                "ORDER BY book_id, page_number"
+            ).fetchall()
+        finally:
+            dal.close()
+        
+        # Group TOCs by book once instead of querying per book
+        self.tocs_by_book = {}
+        for book_id, toc_type, name, page_number in self.tocs_data:
+            self.tocs_by_book.setdefault(book_id, []).append(Toc(toc_type, name, page_number))
 
     def convert_text_with_aksharamukha(self, text, original_script, target_script):
         """
@@ -122,43 +169,143 @@ page: {page}
         if not text or not isinstance(text, str) or text.strip() == "":
             return text
         
+        # Skip text without Burmese code points (ASCII abbreviations, numbers)
+        if _HAS_MYANMAR.search(text) is None:
+            return text
+        
         try:
-            converted = transliterate.process(original_script, target_script, text)
+            converted = _process(original_script, target_script, text)
             return converted
         except Exception as e:
             print(f"Warning: Could not convert '{text[:30]}...' to {target_script}: {str(e)}")
             return text
 
-    def apply_text_corrections(self, text, corrections):
+    def _compile_corrections(self, corrections):
         """
-        Apply correction rules to converted text.
+        Compile correction rules into a single-pass replacement function.
+        
+        Every rule set is applied in one pass over the text. Single-character
+        sources use str.translate and a single rule uses str.replace, both of
+        which run entirely in C; mixed rule sets use one alternation regex.
         
         Args:
-            text: Text to correct
             corrections: List of correction rules
             
+        Returns:
+            Callable taking and returning text, or None if there are no rules
+        """
+        mapping = {
+            correction["from"]: correction.get("to", "")
+            for correction in corrections
+            if correction.get("from")
+        }
+        if not mapping:
+            return None
+        
+        if all(len(from_text) == 1 for from_text in mapping):
+            table = str.maketrans(mapping)
+            return lambda text: text.translate(table)
+        
+        if len(mapping) == 1:
+            ((from_text, to_text),) = mapping.items()
+            return lambda text: text.replace(from_text, to_text)
+        
+        # Longest patterns first so overlapping rules prefer the longer match
+        pattern = re.compile("|".join(
+            re.escape(from_text) for from_text in sorted(mapping, key=len, reverse=True)
+        ))
+        return functools.partial(pattern.sub, lambda match: mapping[match.group(0)])
+
+    def apply_corrections_for_script(self, text, script_code):
+        """
+        Apply a script's correction rules to converted text in a single pass.
+        
+        Args:
+            text: Text to correct
+            script_code: Target script code
+            
         Returns:
             Corrected text
         """
-        if not text or not corrections:
+        compiled_corrections = self.compiled_corrections.get(script_code)
+        if not text or not compiled_corrections:
             return text
         
-        corrected_text = text
-        for correction in corrections:
-            from_text = correction.get("from", "")
-            to_text = correction.get("to", "")
-            if from_text:
-                corrected_text = corrected_text.replace(from_text, to_text)
+        return compiled_corrections(text)
+
+    def convert_text_for_script(self, text, script_code, trans_config):
+        """
+        Convert text to a target script and apply its correction rules.
+        
+        Results are kept in xlit_table per script, since callers always pair
+        the conversion with the script's corrections.
         
-        return corrected_text
+        Args:
+            text: Text to convert
+            script_code: Target script code
+            trans_config: Transliteration configuration for the script (None if none)
+            
+        Returns:
+            Converted text, or the original text for Myanmar / unknown scripts
+        """
+        table = self.xlit_table.setdefault(script_code, {})
+        if text in table:
+            return table[text]
+        
+        converted = text
+        if script_code != 'mymr' and trans_config:
+            converted = self.convert_text_with_aksharamukha(
+                text, trans_config['from'], trans_config['to']
+            )
+            converted = self.apply_corrections_for_script(converted, script_code)
+        
+        table[text] = converted
+        return converted
+
+    def precompute_transliterations(self, books):
+        """
+        Transliterate every unique book and TOC name once per script up front.
+        
+        Each script's table is built in its own worker process and merged into
+        xlit_table, so tree construction only does dictionary lookups.
+        Myanmar needs no conversion and is left to fill lazily.
+        
+        Args:
+            books: Book records to be processed
+        """
+        unique_strings = set()
+        for book in books:
+            unique_strings.add(book.name)
+            unique_strings.add(book.abbr)
+            unique_strings.update(toc.name for toc in self.get_book_tocs(book.id))
+        unique_strings = tuple(unique_strings)
+        
+        target_scripts = [script_code for script_code in self.script_codes if script_code != 'mymr']
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(target_scripts))) as executor:
+            futures = {
+                executor.submit(_transliterate_script, script_code, unique_strings): script_code
+                for script_code in target_scripts
+            }
+            for future in as_completed(futures):
+                script_code = futures[future]
+                self.xlit_table.setdefault(script_code, {}).update(future.result())
+                print(f"  └─ Transliterated {len(unique_strings)} names to {script_code.upper()}")
 
-    def create_directory_structure(self):
-        """Create the basic directory structure for all scripts."""
+    def create_directory_structure(self, clean=False):
+        """
+        Create the basic directory structure for all scripts.
+        
+        Existing trees are kept and files are overwritten in place; only a
+        clean build removes them first (needed to drop stale files).
+        
+        Args:
+            clean: Remove existing script directories before creating them
+        """
         for script in self.script_codes:
             script_dir = self.src_dir / script
             
-            # Remove existing directory if it exists
-            if script_dir.exists():
+            # Remove existing directory only when a clean build is requested
+            if clean and script_dir.exists():
                 shutil.rmtree(script_dir)
             
             # Create directory structure based on sections and subsections
@@ -174,17 +321,15 @@ page: {page}
 
     def get_book_tocs(self, book_id):
         """
-        Get table of contents entries for a specific book from tocs table.
+        Get table of contents entries for a specific book from the preloaded tocs.
         
         Args:
             book_id: Book ID to get TOCs for
             
         Returns:
-            List of TOC entries ordered by page number
+            List of Toc(type, name, page_number) tuples ordered by page number
         """
-        return self.db(self.db.tocs.book_id == book_id).select(
-            orderby=self.db.tocs.page_number
-        )
+        return self.tocs_by_book.get(book_id, [])
 
     def get_transliteration_config(self, script_code):
         """
@@ -196,56 +341,38 @@ page: {page}
         Returns:
             Transliteration configuration dictionary or None
         """
-        return next((config for config in self.transliteration_config 
-                    if config['code'] == script_code), None)
+        return self._trans_by_code.get(script_code)
 
-    def convert_book_content(self, book, chapters, script_code):
+    def convert_book_content(self, book, chapters, script_code, trans_config):
         """
         Convert book and chapter content to target script.
         
         Args:
             book: Book record from database
-            chapters: List of chapter dictionaries
+            chapters: List of chapter dictionaries, or None when only book metadata is needed
             script_code: Target script code
+            trans_config: Transliteration configuration for the script (None if none)
             
         Returns:
-            Tuple of (converted_book_name, converted_book_abbr, converted_chapters)
+            Tuple of (converted_book_name, book_abbr, converted_chapters); the
+            abbreviation is kept in its original form for use in file paths
         """
-        # Default values (Myanmar script)
-        book_name = book.name
-        book_abbr = book.abbr
-        script_chapters = [chapter.copy() for chapter in chapters]
+        chapters = chapters or []
         
-        # Skip conversion for Myanmar script (original)
-        if script_code == 'mymr':
-            return book_name, book_abbr, script_chapters
-        
-        # Get transliteration configuration
-        trans_config = self.get_transliteration_config(script_code)
-        if not trans_config:
-            return book_name, book_abbr, script_chapters
+        # Skip conversion for Myanmar script (original) or scripts without configuration
+        if script_code == 'mymr' or not trans_config:
+            return book.name, book.abbr, list(chapters)
         
         # Convert book name
-        book_name = self.convert_text_with_aksharamukha(
-            book.name, trans_config['from'], trans_config['to']
-        )
-        book_name = self.apply_text_corrections(book_name, trans_config['correction'])
-        
-        # Convert book abbreviation
-        book_abbr = self.convert_text_with_aksharamukha(
-            book.abbr, trans_config['from'], trans_config['to']
-        )
-        book_abbr = self.apply_text_corrections(book_abbr, trans_config['correction'])
+        book_name = self.convert_text_for_script(book.name, script_code, trans_config)
         
-        # Convert chapter names
-        for chapter in script_chapters:
-            converted_name = self.convert_text_with_aksharamukha(
-                chapter['name'], trans_config['from'], trans_config['to']
-            )
-            converted_name = self.apply_text_corrections(converted_name, trans_config['correction'])
-            chapter['name'] = converted_name
+        # Convert chapter names, copying a chapter only when it is converted
+        script_chapters = [
+            {**chapter, 'name': self.convert_text_for_script(chapter['name'], script_code, trans_config)}
+            for chapter in chapters
+        ]
         
-        return book_name, book_abbr, script_chapters
+        return book_name, book.abbr, script_chapters
 
     def determine_book_path(self, book, book_abbr, script_code):
         """
@@ -253,7 +380,7 @@ page: {page}
         
         Args:
             book: Book record from database
-            book_abbr: Book abbreviation (possibly converted)
+            book_abbr: Original book abbreviation
             script_code: Target script code
             
         Returns:
@@ -272,170 +399,191 @@ page: {page}
         """
         Build hierarchical directory structure and files based on TOC types.
         
+        The hierarchy is a flat list of nodes in TOC order. Each node refers
+        to its parent by index (-1 for top-level nodes), so no per-node path
+        copies are made; parents always precede their children.
+        
         Args:
             book_tocs: List of TOC entries for the book
-            book_abbr: Book abbreviation (converted for script)
+            book_abbr: Original book abbreviation
             script_code: Target script code
             
         Returns:
-            Dictionary representing the hierarchical structure
+            List of (parent_index, depth, type, name, page, counter) tuples
         """
         # Define type hierarchy levels
         type_hierarchy = ['chapter', 'title', 'subhead', 'subsubhead', 'subsubhead-head']
+        level_of = {level: index for index, level in enumerate(type_hierarchy)}
         
         # Track counters for each level (reset when going up a level)
-        level_counters = {level: 0 for level in type_hierarchy}
+        level_counters = [0] * len(type_hierarchy)
         
-        # Build structure
-        structure = []
-        current_path = []
+        # Build structure; path_stack holds the node indices of the current path
+        nodes = []
+        path_stack = []
         
-        for toc in book_tocs:
-            toc_type = toc.type
-            
+        for toc_type, toc_name, toc_page in book_tocs:
             # Find the level of current type
-            if toc_type in type_hierarchy:
-                current_level = type_hierarchy.index(toc_type)
-                
-                # Reset counters for deeper levels
-                for i in range(current_level + 1, len(type_hierarchy)):
-                    level_counters[type_hierarchy[i]] = 0
-                
-                # Increment counter for current level
-                level_counters[toc_type] += 1
-                
-                # Adjust current path to match hierarchy level
-                current_path = current_path[:current_level]
-                current_path.append({
-                    'type': toc_type,
-                    'name': toc.name,
-                    'page': toc.page_number,
-                    'counter': level_counters[toc_type],
-                    'level': current_level
-                })
-                
-                structure.append({
-                    'toc': toc,
-                    'path': current_path.copy(),
-                    'counter': level_counters[toc_type]
-                })
+            current_level = level_of.get(toc_type)
+            if current_level is None:
+                continue
+            
+            # Reset counters for deeper levels
+            for i in range(current_level + 1, len(type_hierarchy)):
+                level_counters[i] = 0
+            
+            # Increment counter for current level
+            level_counters[current_level] += 1
+            
+            # Adjust current path to match hierarchy level
+            del path_stack[current_level:]
+            parent_index = path_stack[-1] if path_stack else -1
+            path_stack.append(len(nodes))
+            
+            nodes.append((
+                parent_index, len(path_stack) - 1, toc_type, toc_name, toc_page,
+                level_counters[current_level]
+            ))
         
-        return structure
+        return nodes
 
-    def create_hierarchical_files(self, structure, book_path, book_abbr, script_code):
+    def create_hierarchical_files(self, structure, book_path, book_abbr, script_code, trans_config):
         """
         Create files and directories based on hierarchical structure.
         Each TOC item becomes a directory with an index.md file inside.
 
         Args:
-            structure: Hierarchical structure from build_hierarchical_structure
+            structure: Node list from build_hierarchical_structure
             book_path: Base path for the book
-            book_abbr: Book abbreviation
+            book_abbr: Book abbreviation as displayed (converted for script)
             script_code: Target script code
+            trans_config: Transliteration configuration for the script (None if none)
         """
-        # Ensure book path exists
-        book_path.mkdir(parents=True, exist_ok=True)
-        
-        for i, item in enumerate(structure):
-            toc = item['toc']
-            path_parts = item['path']
+        # Resolve each node's directory from its parent's (parents come first)
+        node_dirs = []
+        for parent_index, _, _, _, _, counter in structure:
+            parent_dir = node_dirs[parent_index] if parent_index >= 0 else book_path
+            node_dirs.append(parent_dir / str(counter))
+        
+        # Create only the deepest directories; os.makedirs creates their ancestors
+        parent_indexes = {node[0] for node in structure}
+        os.makedirs(book_path, exist_ok=True)
+        for index in set(range(len(structure))) - parent_indexes:
+            os.makedirs(node_dirs[index], exist_ok=True)
+        
+        # Ancestor chain label per node, e.g. "chapter > title"
+        node_labels = []
+        
+        for index, (parent_index, _, _, name, page, counter) in enumerate(structure):
+            # Convert text if needed for this node (a lookup in xlit_table)
+            converted_name = self.convert_text_for_script(name, script_code, trans_config)
+            
+            # Prepare parent information
+            parent_info = node_labels[parent_index] if parent_index >= 0 else book_abbr
+            node_labels.append(
+                f"{node_labels[parent_index]} > {converted_name}" if parent_index >= 0 else converted_name
+            )
             
-            if not path_parts:
+            # Create index.md file in this directory
+            current_dir = node_dirs[index]
+            index_file = current_dir / "index.md"
+            
+            # Only write each index.md once per (book, script) tree; files from earlier builds are overwritten
+            index_key = str(index_file)
+            if index_key in self._written:
                 continue
-                
-            # Build directory path step by step
-            current_dir = book_path
-            parent_names = []
+            self._written.add(index_key)
             
-            # Create directories for all path parts
-            for j, path_part in enumerate(path_parts):
-                dir_name = str(path_part['counter'])
-                current_dir = current_dir / dir_name
-                
-                # Create the directory
-                current_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Convert text if needed for this path part
-                converted_name = path_part['name']
-                if script_code != 'mymr':
-                    trans_config = self.get_transliteration_config(script_code)
-                    if trans_config:
-                        converted_name = self.convert_text_with_aksharamukha(
-                            path_part['name'], trans_config['from'], trans_config['to']
-                        )
-                        converted_name = self.apply_text_corrections(
-                            converted_name, trans_config['correction']
-                        )
-                
-                # Create index.md file in this directory
-                index_file = current_dir / "index.md"
-                
-                # Only create index.md if it doesn't exist (avoid overwriting)
-                if not index_file.exists():
-                    # Prepare parent information
-                    parent_info = ' > '.join(parent_names) if parent_names else book_abbr
-                    
-                    # Write index.md file
-                    try:
-                        with open(index_file, 'w', encoding='utf-8') as f:
-                            f.write(self.content_template.format(
-                                name=converted_name,
-                                order=path_part['counter'],
-                                parent=parent_info,
-                                page=path_part['page']
-                            ))
-                    except Exception as e:
-                        print(f"Error creating file {index_file}: {e}")
-                        print(f"Directory exists: {current_dir.exists()}")
-                        print(f"Parent directory: {current_dir}")
-                        raise
-                
-                # Add this name to parent names for next level
-                parent_names.append(converted_name)
+            # Write index.md file
+            try:
+                index_file.write_bytes((self.content_template % (
+                    converted_name, counter, parent_info, page, converted_name, page
+                )).encode('utf-8'))
+            except Exception as e:
+                print(f"Error creating file {index_file}: {e}")
+                print(f"Directory exists: {current_dir.exists()}")
+                print(f"Parent directory: {current_dir}")
+                raise
+
+    def build_book_script(self, book, book_tocs, script_code):
+        """
+        Generate the hierarchical files of a single book for one target script.
+        
+        Args:
+            book: Book record from database
+            book_tocs: List of TOC entries for the book
+            script_code: Target script code
+        """
+        # Each (book, script) pair owns its directory tree, so written paths are tracked per call
+        self._written = set()
+        
+        # Look up the script's configuration once for the whole book
+        trans_config = self.get_transliteration_config(script_code)
+        
+        # Convert book name; the abbreviation stays original for paths
+        book_name, book_abbr, _ = self.convert_book_content(
+            book, None, script_code, trans_config
+        )
+        
+        # Converted abbreviation is only displayed as the parent of top-level entries
+        display_abbr = self.convert_text_for_script(book_abbr, script_code, trans_config)
+        
+        # Determine base book path
+        book_path = self.determine_book_path(book, book_abbr, script_code)
+        
+        # Build hierarchical structure
+        structure = self.build_hierarchical_structure(book_tocs, book_abbr, script_code)
+        
+        # Create files and directories
+        self.create_hierarchical_files(structure, book_path, display_abbr, script_code, trans_config)
 
     def process_mula_books(self):
-        """Process all books with basket = 'mula' and generate files for all scripts."""
-        mula_books = self.db(self.db.books.basket == 'mula').select()
+        """
+        Process all books with basket = 'mula' and generate files for all scripts.
+        
+        Each (book, script) pair writes to its own directory, so the pairs are
+        distributed over a process pool. Names are first transliterated on
+        the pool, one task per script; the merged table is then handed to
+        the writer workers, which only do lookups and file I/O.
+        """
+        mula_books = self.books_data
         total_books = len(mula_books)
         total_scripts = len(self.script_codes)
         
         print(f"Processing {total_books} mula books across {total_scripts} scripts...")
         
-        for book_idx, book in enumerate(mula_books, 1):
-            print(f"\n[{book_idx}/{total_books}] Processing book: {book.name} (ID: {book.id})")
-            
-            # Get TOCs from tocs table
-            book_tocs = self.get_book_tocs(book.id)
-            toc_count = len(book_tocs)
-            print(f"  └─ Found {toc_count} TOC entries")
-            
-            if toc_count == 0:
-                print(f"  └─ No TOC entries found for book {book.id}, skipping...")
-                continue
-            
-            # Process each script
-            for script_idx, script_code in enumerate(self.script_codes, 1):
-                print(f"  [{script_idx}/{total_scripts}] Converting to {script_code.upper()} script...", end=" ")
-                
-                # Convert book name and abbreviation
-                book_name, book_abbr, _ = self.convert_book_content(
-                    book, [], script_code
-                )
-                
-                # Determine base book path
-                book_path = self.determine_book_path(book, book_abbr, script_code)
+        # Transliterate all names (in parallel per script) before any file is written
+        self.precompute_transliterations(mula_books)
+        
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker, initargs=(self.xlit_table,)
+        ) as executor:
+            futures = {}
+            for book_idx, book in enumerate(mula_books, 1):
+                print(f"[{book_idx}/{total_books}] Queueing book: {book.name} (ID: {book.id})")
                 
-                # Build hierarchical structure
-                structure = self.build_hierarchical_structure(book_tocs, book_abbr, script_code)
+                # Get TOCs from tocs table
+                book_tocs = self.get_book_tocs(book.id)
+                toc_count = len(book_tocs)
+                print(f"  └─ Found {toc_count} TOC entries")
                 
-                # Create files and directories
-                self.create_hierarchical_files(structure, book_path, book_abbr, script_code)
+                if toc_count == 0:
+                    print(f"  └─ No TOC entries found for book {book.id}, skipping...")
+                    continue
                 
-                print("✓ Complete")
+                # Submit one task per script; Book and Toc tuples pickle directly
+                for script_code in self.script_codes:
+                    future = executor.submit(_build_book_script, book, book_tocs, script_code)
+                    futures[future] = (book.id, script_code)
+            
+            for future in as_completed(futures):
+                book_id, script_code = futures[future]
+                future.result()
+                print(f"  └─ {book_id} [{script_code.upper()}] ✓ Complete")
         
         print(f"\nAll {total_books} books processed successfully across {total_scripts} scripts!")
 
-    def build(self):
+    def build(self, clean=False):
         """
         Main build process - execute all steps to generate documentation files.
         
@@ -444,6 +592,9 @@ page: {page}
         2. Create directory structure
         3. Process and convert content
         4. Generate Markdown files
+        
+        Args:
+            clean: Remove previously generated script trees before building
         """
         print("Starting Tipitaka documentation build process...")
         
@@ -453,7 +604,7 @@ page: {page}
         
         # Step 2: Create directory structure
         print("Creating directory structure...")
-        self.create_directory_structure()
+        self.create_directory_structure(clean=clean)
         
         # Step 3: Process books and generate files
         print("Processing books and generating files...")
@@ -462,7 +613,37 @@ page: {page}
         print("Build process completed successfully!")
 
 
+# === Worker Processes ===
+_worker_builder = None
+
+
+def _init_worker(xlit_table):
+    """Create a per-process builder sharing the precomputed transliteration table."""
+    global _worker_builder
+    _worker_builder = TipitakaBuilder()
+    _worker_builder.xlit_table = xlit_table
+
+
+def _transliterate_script(script_code, texts):
+    """Build one script's transliteration table inside a worker process."""
+    builder = TipitakaBuilder()
+    trans_config = builder.get_transliteration_config(script_code)
+    for text in texts:
+        builder.convert_text_for_script(text, script_code, trans_config)
+    return builder.xlit_table.get(script_code, {})
+
+
+def _build_book_script(book, book_tocs, script_code):
+    """Build one (book, script) pair inside a worker process."""
+    _worker_builder.build_book_script(book, book_tocs, script_code)
+
+
 # === Main Execution ===
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Tipitaka TOC tree for all scripts")
+    parser.add_argument("--clean", action="store_true",
+                        help="remove previously generated script trees before building")
+    args = parser.parse_args()
+    
     builder = TipitakaBuilder()
-    builder.build()
+    builder.build(clean=args.clean)
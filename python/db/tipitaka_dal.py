@@ -6,6 +6,7 @@ Provides models and database connection for Tipitaka Pali database
 
 from pydal import DAL, Field
 import os
+import sqlite3
 from datetime import datetime
 
 class TipitakaDAL:
@@ -28,6 +29,7 @@ class TipitakaDAL:
         
         self.db_path = db_path
         self.db = None
+        self._raw_conn = None
         
         if auto_connect:
             self.connect()
@@ -147,12 +149,26 @@ class TipitakaDAL:
             migrate=False
         )
 
+    @property
+    def raw_conn(self):
+        """
+        Plain sqlite3 connection for hot read-only queries
+        
+        Returns tuples directly, skipping pyDAL Row construction.
+        """
+        if self._raw_conn is None:
+            self._raw_conn = sqlite3.connect(self.db_path)
+        return self._raw_conn
+
     def close(self):
         """
         Close database connection
         """
         if self.db:
             self.db.close()
+        if self._raw_conn is not None:
+            self._raw_conn.close()
+            self._raw_conn = None
     
     def __enter__(self):
         """